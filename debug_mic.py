@@ -5,23 +5,51 @@ Tests if audio is actually being captured from your microphone.
 """
 
 import pyaudio
-import struct
 import math
+import sys
 import time
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 SAMPLE_RATE = 16000
 NUM_CHANNELS = 1
 CHUNK_SIZE = 3200
 DURATION_SECS = 5
+STREAM_BUFFER_FRAMES = CHUNK_SIZE * 4  # Headroom so redraws don't overrun the device buffer
+METER_WIDTH = 40
+METER_FULL = "█" * METER_WIDTH
+METER_EMPTY = "░" * METER_WIDTH
+METER_FLUSH_EVERY = 4  # redraws between explicit stdout flushes
+
+# Reused float32 scratch so the per-chunk RMS does not allocate
+_rms_scratch = np.empty(CHUNK_SIZE, dtype=np.float32) if np is not None else None
 
 def get_rms(data: bytes) -> float:
     """Calculate RMS (volume level) of audio data."""
-    count = len(data) // 2
-    format_str = f"{count}h"
-    shorts = struct.unpack(format_str, data)
-    sum_squares = sum(s * s for s in shorts)
-    rms = math.sqrt(sum_squares / count) if count > 0 else 0
-    return rms
+    if np is not None:
+        samples = np.frombuffer(data, dtype=np.int16)
+        n = samples.size
+        if n == 0:
+            return 0.0
+        if n <= CHUNK_SIZE:
+            f = _rms_scratch[:n]
+            np.copyto(f, samples)
+        else:
+            f = samples.astype(np.float32)
+        return float(np.sqrt(np.dot(f, f) / n))
+
+    # Zero-copy int16 view over the PyAudio buffer
+    shorts = memoryview(data)[: len(data) // 2 * 2].cast("h")
+    count = len(shorts)
+    if count == 0:
+        return 0.0
+    sum_squares = 0
+    for s in shorts:
+        sum_squares += s * s
+    return math.sqrt(sum_squares / count)
 
 def main():
     print("🎙 Microphone Diagnostic Tool")
@@ -66,7 +94,7 @@ def main():
             rate=SAMPLE_RATE,
             input=True,
             input_device_index=default_idx,
-            frames_per_buffer=CHUNK_SIZE
+            frames_per_buffer=STREAM_BUFFER_FRAMES
         )
     except Exception as e:
         print(f"❌ Failed to open audio stream: {e}")
@@ -80,26 +108,35 @@ def main():
     max_rms = 0
     chunks_with_audio = 0
     total_chunks: int = 0
+    redraws = 0
     
     start_time = time.time()
     
     while time.time() - start_time < DURATION_SECS:
         try:
             data = stream.read(CHUNK_SIZE, exception_on_overflow=False)
-            rms = get_rms(data)
-            total_chunks += 1
-            
-            if rms > max_rms:
-                max_rms = rms
-            
-            if rms > 500:  # Above noise floor
-                chunks_with_audio += 1
+            while True:
+                rms = get_rms(data)
+                total_chunks += 1
+
+                if rms > max_rms:
+                    max_rms = rms
+
+                if rms > 500:  # Above noise floor
+                    chunks_with_audio += 1
+
+                # Drain chunks that queued up while we were busy, meter shows the latest
+                if stream.get_read_available() < CHUNK_SIZE:
+                    break
+                data = stream.read(CHUNK_SIZE, exception_on_overflow=False)
             
             # Visual meter
-            bars = int(rms / 500)
-            bars = min(bars, 40)
-            meter = "█" * bars + "░" * (40 - bars)
-            print(f"\r   Level: [{meter}] {int(rms):5d}", end="", flush=True)
+            bars = min(int(rms / 500), METER_WIDTH)
+            sys.stdout.write(f"\r   Level: [{METER_FULL[:bars]}{METER_EMPTY[bars:]}] {int(rms):5d}")
+            # Count redraws, not chunks: draining can skip past every multiple of 4
+            redraws += 1
+            if redraws % METER_FLUSH_EVERY == 0:
+                sys.stdout.flush()
             
         except Exception as e:
             print(f"\n❌ Error reading audio: {e}")
@@ -4,11 +4,22 @@ Live Translator - Real-time transcription and translation.
 Interactive UI with scroll mode for viewing conversation history.
 """
 
-from .session import Session, SpeakerProfile
-from .transcription import Transcriber, SAMPLE_RATE, NUM_CHANNELS, CHUNK_SIZE, list_audio_devices
-from .ui import LiveTranscriptUI
+from importlib import import_module
+
 from .languages import SONIOX_LANGUAGES, get_language_name, get_language_flag, get_all_language_codes
 
+# Submodules that pull in pyaudio, websockets, rich, etc. are imported on first access
+_LAZY_ATTRIBUTES = {
+    "Session": "session",
+    "SpeakerProfile": "session",
+    "Transcriber": "transcription",
+    "SAMPLE_RATE": "transcription",
+    "NUM_CHANNELS": "transcription",
+    "CHUNK_SIZE": "transcription",
+    "list_audio_devices": "transcription",
+    "LiveTranscriptUI": "ui",
+}
+
 __all__ = [
     "Session",
     "SpeakerProfile",
@@ -23,3 +34,12 @@ __all__ = [
     "NUM_CHANNELS",
     "CHUNK_SIZE",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
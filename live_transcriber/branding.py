@@ -4,9 +4,13 @@ Brand and logo lookup for startup CLI messaging.
 
 from __future__ import annotations
 
+import hashlib
 import io
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import quote
 from urllib.request import Request, urlopen
@@ -16,6 +20,16 @@ from rich.text import Text
 BRANDFETCH_BRAND_API = "https://api.brandfetch.io/v2/brands/{domain}"
 BRANDFETCH_LOGO_API = "https://logo.brandfetch.io/{domain}"
 
+CACHE_DIR = Path("~/.cache/mother-in-law-decoder").expanduser()
+CACHE_TTL_SEC = 7 * 86400
+
+# Per-channel lookup table keeping the top 3 bits, used by the "pixelated" style
+_POSTERIZE_LUT = [value & 0xE0 for value in range(256)]
+
+MAX_LOGO_BYTES = 2 * 1024 * 1024
+
+USER_AGENT = "mother-in-law-decoder/1.0"
+
 try:
     from PIL import Image
     from PIL import ImageFilter
@@ -23,6 +37,11 @@ try:
 except ImportError:
     Image = None  # type: ignore[assignment]
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 
 @dataclass
 class BrandInfo:
@@ -50,6 +69,30 @@ def _default_brand_name(domain: str) -> str:
     return root.capitalize() if root else domain
 
 
+def _cache_path(kind: str, key: str, suffix: str) -> Path:
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{kind}_{digest}{suffix}"
+
+
+def _read_cache(path: Path) -> Optional[bytes]:
+    """Return cached bytes if present and fresh, else None."""
+    try:
+        if time.time() - path.stat().st_mtime >= CACHE_TTL_SEC:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write_cache(path: Path, data: bytes) -> None:
+    """Best-effort cache write; an unwritable cache dir is ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    except OSError:
+        pass
+
+
 def _pick_logo_url(brand_data: dict[str, Any]) -> Optional[str]:
     logos = brand_data.get("logos") or []
     preferred_types = ("icon", "logo", "symbol")
@@ -99,24 +142,40 @@ def fetch_brand_info(
     if not api_key:
         return fallback
 
+    cache_path = _cache_path("brand", f"{clean_domain}|{api_key}", ".json")
+    cached = _read_cache(cache_path)
+    if cached is not None:
+        try:
+            payload = json.loads(cached.decode("utf-8"))
+        except ValueError:
+            payload = None
+        if isinstance(payload, dict):
+            return _brand_info_from_payload(payload, fallback)
+
     request = Request(
         BRANDFETCH_BRAND_API.format(domain=quote(clean_domain)),
         headers={
             "Authorization": f"Bearer {api_key}",
             "Accept": "application/json",
-            "User-Agent": "mother-in-law-decoder/1.0",
+            "User-Agent": USER_AGENT,
         },
     )
 
     try:
         with urlopen(request, timeout=timeout_sec) as response:
-            payload = json.loads(response.read().decode("utf-8"))
+            raw = response.read()
+        payload = json.loads(raw.decode("utf-8"))
     except Exception:
         return fallback
 
+    _write_cache(cache_path, raw)
+    return _brand_info_from_payload(payload, fallback)
+
+
+def _brand_info_from_payload(payload: dict[str, Any], fallback: BrandInfo) -> BrandInfo:
     name = str(payload.get("name") or fallback.name)
     logo_url = _pick_logo_url(payload) or fallback.logo_url
-    return BrandInfo(name=name, domain=clean_domain, logo_url=logo_url)
+    return BrandInfo(name=name, domain=fallback.domain, logo_url=logo_url)
 
 
 def build_brand_intro(
@@ -124,25 +183,39 @@ def build_brand_intro(
     target_domain: str = "apple.com",
     api_key: Optional[str] = None,
 ) -> BrandIntro:
-    source = fetch_brand_info(source_domain, api_key=api_key)
-    target = fetch_brand_info(target_domain, api_key=api_key)
-    return BrandIntro(source=source, target=target)
+    # Both lookups are network-bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source = executor.submit(fetch_brand_info, source_domain, api_key)
+        target = executor.submit(fetch_brand_info, target_domain, api_key)
+        return BrandIntro(source=source.result(), target=target.result())
 
 
 def fetch_logo_bytes(logo_url: str, timeout_sec: float = 2.0) -> Optional[bytes]:
-    """Fetch logo bytes from URL."""
+    """Fetch logo bytes from URL, using the on-disk cache when fresh."""
+    cache_path = _cache_path("logo", logo_url, ".bin")
+    cached = _read_cache(cache_path)
+    if cached:
+        return cached
+
     request = Request(
         logo_url,
         headers={
             "Accept": "image/*",
-            "User-Agent": "mother-in-law-decoder/1.0",
+            "User-Agent": USER_AGENT,
         },
     )
     try:
         with urlopen(request, timeout=timeout_sec) as response:
-            return response.read()
+            # Read one byte past the cap to detect oversized logos
+            data = response.read(MAX_LOGO_BYTES + 1)
     except Exception:
         return None
+    if len(data) > MAX_LOGO_BYTES:
+        return None
+
+    if data:
+        _write_cache(cache_path, data)
+    return data
 
 
 def can_render_images() -> bool:
@@ -162,7 +235,12 @@ def render_logo_text(
 
     try:
         with Image.open(io.BytesIO(logo_bytes)) as img:
+            # Shrink early so compositing and filters run on a small image.
+            # draft() lets JPEG decode at reduced scale; other formats ignore it.
+            prescale = (max_width_chars * 4, max_height_chars * 8)
+            img.draft("RGB", prescale)
             rgba = img.convert("RGBA")
+            rgba.thumbnail(prescale, Image.Resampling.BILINEAR)
     except Exception:
         return None
 
@@ -197,7 +275,8 @@ def render_logo_text(
         tiny_w = max(6, out_w // 2)
         tiny_h = max(6, out_h // 2)
         tiny = composed.resize((tiny_w, tiny_h), Image.Resampling.BILINEAR)
-        tiny = tiny.quantize(colors=20, method=Image.Quantize.MEDIANCUT).convert("RGB")
+        # Posterize to 3 bits per channel; a lookup table is far cheaper than median cut.
+        tiny = tiny.point(_POSTERIZE_LUT * 3)
         resized = tiny.resize((out_w, out_h), Image.Resampling.NEAREST)
     else:
         resized = composed.resize((out_w, out_h), Image.Resampling.LANCZOS)
@@ -206,15 +285,26 @@ def render_logo_text(
         # Push near-monochrome logos (like Apple) to cleaner edges.
         gray = ImageOps.grayscale(resized)
         resized = gray.point(lambda p: 255 if p > 165 else 0).convert("RGB")
-    px = resized.load()
+
+    # Pull all pixels out in one call instead of indexing PIL per pixel
+    if np is not None:
+        rows = np.asarray(resized, dtype=np.uint8).tolist()
+    else:
+        data = list(resized.getdata())
+        rows = [data[y * out_w:(y + 1) * out_w] for y in range(out_h)]
+
+    # Flat logo regions repeat the same color pair, so format each style once
+    style_cache: dict[int, str] = {}
 
     text = Text()
     for y in range(0, out_h, 2):
-        for x in range(out_w):
-            r1, g1, b1 = px[x, y]
-            r2, g2, b2 = px[x, y + 1]
-            style = f"rgb({r1},{g1},{b1}) on rgb({r2},{g2},{b2})"
-            text.append("▀", style=style)
+        for (r1, g1, b1), (r2, g2, b2) in zip(rows[y], rows[y + 1]):
+            key = (r1 << 40) | (g1 << 32) | (b1 << 24) | (r2 << 16) | (g2 << 8) | b2
+            cell_style = style_cache.get(key)
+            if cell_style is None:
+                cell_style = f"rgb({r1},{g1},{b1}) on rgb({r2},{g2},{b2})"
+                style_cache[key] = cell_style
+            text.append("▀", style=cell_style)
         if y + 2 < out_h:
             text.append("\n")
 
@@ -7,7 +7,12 @@ from prompt_toolkit.layout import Layout, Window, FormattedTextControl
 from prompt_toolkit.styles import Style
 from rich.console import Console
 
-from .languages import SONIOX_LANGUAGES, get_language_flag, search_languages
+from .languages import (
+    LANGUAGES_BY_NAME,
+    SORTED_LANGUAGES,
+    get_language_flag,
+    search_languages,
+)
 
 
 class LanguageSelector:
@@ -16,18 +21,27 @@ class LanguageSelector:
     def __init__(self, title: str, multi_select: bool):
         self.title = title
         self.multi_select = multi_select
-        self.all_languages = [(code, lang["name"]) for code, lang in sorted(SONIOX_LANGUAGES.items())]
+        self.all_languages = list(SORTED_LANGUAGES)
         self.filtered = self.all_languages
         self.search = ""
+        self._last_search = ""
+        self._matches: list[tuple[str, str]] = list(LANGUAGES_BY_NAME)
         self.cursor = 0
         self.selected: set[str] = set()
         self.result: Optional[list[str]] = None
         self.cancelled = False
 
+        # Fragments that never change between redraws
+        self._head_fragments = (("class:title", f"{title}\n\n"), ("class:dim", "Search: "))
+        if multi_select:
+            hint = "arrows=scroll | space=select | enter=done | esc=cancel"
+        else:
+            hint = "arrows=scroll | enter=select | esc=cancel"
+        self._tail_fragments = (("", "\n"), ("class:hint", hint))
+
     def get_display_text(self) -> list[tuple[str, str]]:
         """Generate the display text for the selector UI."""
-        lines = [("class:title", f"{self.title}\n\n")]
-        lines.append(("class:dim", "Search: "))
+        lines = list(self._head_fragments)
         lines.append(("class:search", self.search or ""))
         lines.append(("class:cursor", "_\n"))
         if not self.search:
@@ -57,14 +71,24 @@ class LanguageSelector:
         if end < len(self.filtered):
             lines.append(("class:dim", f"  v {len(self.filtered) - end} more below\n"))
 
-        lines.append(("", "\n"))
-        if self.multi_select:
-            lines.append(("class:hint", "arrows=scroll | space=select | enter=done | esc=cancel"))
-        else:
-            lines.append(("class:hint", "arrows=scroll | enter=select | esc=cancel"))
-
+        lines.extend(self._tail_fragments)
         return lines
 
+    def update_filter(self) -> None:
+        """Refresh filtered languages after the search text changed."""
+        if self._last_search and self.search.startswith(self._last_search):
+            # Query was extended: narrow the previous matches instead of rescanning
+            self.filtered = search_languages(self.search, self._matches)
+            candidates = self._matches
+        else:
+            self.filtered = search_languages(self.search)
+            candidates = LANGUAGES_BY_NAME
+        # Keep the matches in name order for the next narrowing step
+        matched = set(self.filtered)
+        self._matches = [entry for entry in candidates if entry in matched]
+        self._last_search = self.search
+        self.cursor = min(self.cursor, max(0, len(self.filtered) - 1))
+
     def create_app(self) -> Application:
         """Create the prompt_toolkit Application."""
         kb = KeyBindings()
@@ -108,16 +132,14 @@ class LanguageSelector:
         def handle_backspace(event):
             if selector.search:
                 selector.search = selector.search[:-1]
-                selector.filtered = search_languages(selector.search)
-                selector.cursor = min(selector.cursor, max(0, len(selector.filtered) - 1))
+                selector.update_filter()
 
         @kb.add("<any>")
         def handle_char(event):
             key = event.data
             if len(key) == 1 and key.isalpha():
                 selector.search += key.lower()
-                selector.filtered = search_languages(selector.search)
-                selector.cursor = min(selector.cursor, max(0, len(selector.filtered) - 1))
+                selector.update_filter()
 
         style = Style.from_dict({
             "title": "bold #165b33",  # Dark Christmas green
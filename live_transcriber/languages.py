@@ -2,6 +2,8 @@
 Language configuration and utilities for all Soniox-supported languages.
 """
 
+from typing import Optional
+
 # All 60+ Soniox-supported languages with names and flag emojis
 SONIOX_LANGUAGES = {
     "ar": {"name": "Arabic", "flag": "🇸🇦"},
@@ -57,6 +59,21 @@ SONIOX_LANGUAGES = {
     "vi": {"name": "Vietnamese", "flag": "🇻🇳"},
 }
 
+# (code, name) pairs sorted by code, computed once at import
+SORTED_LANGUAGES: tuple[tuple[str, str], ...] = tuple(
+    (code, lang["name"]) for code, lang in sorted(SONIOX_LANGUAGES.items())
+)
+
+# (code, name) pairs sorted by name, so search buckets fill in display order
+LANGUAGES_BY_NAME: tuple[tuple[str, str], ...] = tuple(
+    sorted(SORTED_LANGUAGES, key=lambda entry: entry[1])
+)
+
+# (code, name, lowercase name) triples used by search_languages
+_SEARCH_INDEX: tuple[tuple[str, str, str], ...] = tuple(
+    (code, name, name.lower()) for code, name in LANGUAGES_BY_NAME
+)
+
 
 def get_language_name(code: str) -> str:
     """Get the display name for a language code."""
@@ -74,40 +91,52 @@ def get_language_flag(code: str) -> str:
     return "🌐"
 
 
+# Constant-time membership checks for validating user-supplied codes
+LANGUAGE_CODES = frozenset(SONIOX_LANGUAGES)
+
+
 def get_all_language_codes() -> list[str]:
     """Get all supported language codes."""
     return sorted(SONIOX_LANGUAGES.keys())
 
 
-def search_languages(query: str) -> list[tuple[str, str]]:
+def search_languages(
+    query: str,
+    candidates: Optional[list[tuple[str, str]]] = None,
+) -> list[tuple[str, str]]:
     """
     Search languages by name or code.
     Returns list of (code, name) tuples sorted by relevance.
+
+    If candidates is given, only those (code, name) pairs are searched. They
+    must be in name order (see LANGUAGES_BY_NAME). Every match for a query
+    also matches its prefixes, so callers can pass the previous matches when
+    the query was extended.
     """
     if not query:
-        return [(code, lang["name"]) for code, lang in sorted(SONIOX_LANGUAGES.items())]
+        return list(SORTED_LANGUAGES)
 
     query_lower = query.lower()
-    results = []
 
-    for code, lang in SONIOX_LANGUAGES.items():
-        name = lang["name"]
-        name_lower = name.lower()
+    if candidates is None:
+        index = _SEARCH_INDEX
+    else:
+        index = tuple((code, name, name.lower()) for code, name in candidates)
 
-        # Exact code match (highest priority)
+    # One bucket per priority; the index is in name order, so no sort is needed
+    exact_code: list[tuple[str, str]] = []
+    code_prefix: list[tuple[str, str]] = []
+    name_prefix: list[tuple[str, str]] = []
+    name_contains: list[tuple[str, str]] = []
+
+    for code, name, name_lower in index:
         if code == query_lower:
-            results.append((0, code, name))
-        # Code starts with query
+            exact_code.append((code, name))
         elif code.startswith(query_lower):
-            results.append((1, code, name))
-        # Name starts with query
+            code_prefix.append((code, name))
         elif name_lower.startswith(query_lower):
-            results.append((2, code, name))
-        # Name contains query
+            name_prefix.append((code, name))
         elif query_lower in name_lower:
-            results.append((3, code, name))
-
-    # Sort by priority (lower number = higher priority), then alphabetically
-    results.sort(key=lambda x: (x[0], x[2]))
+            name_contains.append((code, name))
 
-    return [(code, name) for _, code, name in results]
+    return exact_code + code_prefix + name_prefix + name_contains
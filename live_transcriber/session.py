@@ -2,25 +2,128 @@
 Session management and speaker profiling for transcription sessions.
 """
 
+import atexit
 import json
 import os
+import threading
+import time
 import wave
+import weakref
+from array import array
 import subprocess
 from datetime import datetime
-from typing import Optional
+from typing import BinaryIO, Optional
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import lameenc
+except ImportError:
+    lameenc = None  # type: ignore[assignment]
+
 # Audio settings (shared with transcription module)
 SAMPLE_RATE = 16000
 NUM_CHANNELS = 1
 AUDIO_SAMPLE_WIDTH = 2  # 16-bit PCM
+AUDIO_PREALLOC_BYTES = 60 * SAMPLE_RATE * NUM_CHANNELS * AUDIO_SAMPLE_WIDTH  # First minute
+WAV_WRITE_BUFFER_SIZE = 1 << 20  # Coalesce WAV header and payload writes
+JSON_WRITE_BUFFER_SIZE = 1 << 20
+MP3_BIT_RATE = 192  # kbps, close to ffmpeg's -qscale:a 2
+MP3_ENCODER_QUALITY = 2  # LAME quality, 2 = high
+MP3_ENCODE_CHUNK_BYTES = 1 << 20  # PCM fed to the encoder per call (sample-aligned)
 
 # Language confidence threshold
 LANGUAGE_CONFIDENCE_THRESHOLD = 0.5
 
+# Checkpoint state at most this often while tokens are arriving
+STATE_SAVE_INTERVAL_SEC = 2.0
+STATE_SAVE_MAX_DIRTY_TOKENS = 64
+
 # Timestamp format for segment filenames
 SEGMENT_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
 
+# Per-token flag bits kept alongside final_tokens
+TOKEN_FLAG_TRANSLATION = 1
+TOKEN_FLAG_SKIP = 2  # Translation whose source is already the target language
+
+# Session metadata, rewritten on each checkpoint
+STATE_FILENAME = "session_state.json"
+
+# Append-only log of finalized tokens, one JSON object per line
+TOKEN_LOG_FILENAME = "tokens.jsonl"
+
+
+# Open sessions, checkpointed by a single exit hook without being kept alive by it
+_open_sessions: "weakref.WeakSet[Session]" = weakref.WeakSet()
+
+
+@atexit.register
+def _save_open_sessions() -> None:
+    """Persist whatever is still pending if the process exits without saving."""
+    for session in list(_open_sessions):
+        session._save_state_if_dirty()
+
+
+def _write_json(path: str, data: dict) -> None:
+    """Atomically write data as compact UTF-8 JSON, using orjson when available.
+
+    The file is written and fsynced to a temporary sibling, then renamed into
+    place, so a crash mid-write never leaves a truncated file behind.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_encode_json(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _encode_json(data) -> bytes:
+    """Encode data as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _encode_json_line(data: dict) -> bytes:
+    """Encode data as a single compact JSON line."""
+    return _encode_json(data) + b"\n"
+
+
+def _write_json_streamed(path: str, data: dict, stream_key: str) -> None:
+    """Atomically write data as JSON, encoding data[stream_key] one item per line.
+
+    Only one list item is encoded at a time, so large token lists don't need a
+    full in-memory copy of the encoded document.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb", buffering=JSON_WRITE_BUFFER_SIZE) as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(data.items()):
+            f.write(b"\n  " if i == 0 else b",\n  ")
+            f.write(_encode_json(key))
+            f.write(b": ")
+            if key != stream_key:
+                f.write(_encode_json(value))
+                continue
+            f.write(b"[")
+            for j, item in enumerate(value):
+                f.write(b"\n    " if j == 0 else b",\n    ")
+                f.write(_encode_json(item))
+            f.write(b"\n  ]" if value else b"]")
+        f.write(b"\n}")
+    os.replace(tmp_path, path)
+
+
+def _decode_json(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class SpeakerProfile:
     """Track language usage for a speaker."""
@@ -30,18 +133,25 @@ class SpeakerProfile:
         self.language_counts: dict[str, int] = defaultdict(int)
         self.last_language: Optional[str] = None
         self.total_samples = 0
+        # Cached result of get_dominant_language, recomputed after new samples
+        self._dominant_language: Optional[str] = None
+        self._dominant_dirty = False
     
     def add_sample(self, language: str) -> None:
         """Record a language sample for this speaker."""
         self.language_counts[language] += 1
         self.last_language = language
         self.total_samples += 1
+        self._dominant_dirty = True
     
     def get_dominant_language(self) -> Optional[str]:
         """Get the most used language, or None if no samples."""
         if not self.language_counts:
             return None
-        return max(self.language_counts, key=self.language_counts.get)
+        if self._dominant_dirty:
+            self._dominant_language = max(self.language_counts, key=self.language_counts.get)
+            self._dominant_dirty = False
+        return self._dominant_language
     
     def get_label(self) -> str:
         """Get display label for speaker."""
@@ -60,6 +170,7 @@ class SpeakerProfile:
         """Deserialize from dictionary."""
         profile = cls(speaker_id)
         profile.language_counts = defaultdict(int, data.get("language_counts", {}))
+        profile._dominant_dirty = True
         profile.last_language = data.get("last_language")
         profile.total_samples = data.get("total_samples", 0)
         return profile
@@ -80,19 +191,55 @@ class Session:
         self.source_languages = source_languages
         self.target_language = target_language
         self.session_dir = os.path.join(base_dir, "output", name)
-        self.state_file = os.path.join(self.session_dir, "session_state.json")
+        self.state_file = os.path.join(self.session_dir, STATE_FILENAME)
+        self.token_log_file = os.path.join(self.session_dir, TOKEN_LOG_FILENAME)
         self.speaker_profiles: dict[int, SpeakerProfile] = {}
         self.final_tokens: list[dict] = []
         self.segment_count = 0
-        self.audio_frames: list[bytes] = []
+        # Preallocated PCM buffer; only the first _audio_size bytes are valid
+        self._audio_buffer = bytearray(AUDIO_PREALLOC_BYTES)
+        self._audio_size = 0
         self._was_resumed = False
+        self._token_log: Optional[BinaryIO] = None
+        # (speaker_id, profile) as one tuple so threads never see a mismatched pair
+        self._last_profile: Optional[tuple[int, SpeakerProfile]] = None
+        self._state_lock = threading.Lock()
+        self._last_state_save = 0.0
+        self._dirty_tokens = 0
+
+        # Indexes over final_tokens, built on first use and extended lazily
+        self._tokens_by_speaker: dict[int, list[dict]] = defaultdict(list)
+        self._source_tokens: list[dict] = []
+        self._token_flags = array("B")
+        self._indexed_target_language = target_language
 
         # Create session directory
         os.makedirs(self.session_dir, exist_ok=True)
 
         # Load existing state if resuming
         self._load_state()
+
+        _open_sessions.add(self)
     
+    @classmethod
+    def peek_languages(cls, name: str, base_dir: str) -> Optional[tuple[list[str], str]]:
+        """Read a saved session's language config without loading the session.
+
+        Returns None if the session doesn't exist, its state is unreadable, or it
+        has no language config (sessions saved before it was stored).
+        """
+        state_file = os.path.join(base_dir, "output", name, STATE_FILENAME)
+        try:
+            with open(state_file, "rb") as f:
+                state = _decode_json(f.read())
+            source_languages = state["source_languages"]
+            target_language = state["target_language"]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+        if not source_languages or not target_language:
+            return None
+        return source_languages, target_language
+
     @property
     def was_resumed(self) -> bool:
         """Check if session was resumed from existing state."""
@@ -102,8 +249,8 @@ class Session:
         """Load session state if it exists."""
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, "r", encoding="utf-8") as f:
-                    state = json.load(f)
+                with open(self.state_file, "rb") as f:
+                    state = _decode_json(f.read())
 
                 self.segment_count = state.get("segment_count", 0)
                 self.final_tokens = state.get("tokens", [])
@@ -114,14 +261,91 @@ class Session:
                     self.target_language = state["target_language"]
 
                 # Restore speaker profiles
+                # JSON object keys are always strings, so convert each id once
                 for sid, profile_data in state.get("speaker_profiles", {}).items():
-                    self.speaker_profiles[int(sid)] = SpeakerProfile.from_dict(
-                        int(sid), profile_data
+                    speaker_id = int(sid)
+                    self.speaker_profiles[speaker_id] = SpeakerProfile.from_dict(
+                        speaker_id, profile_data
                     )
 
                 self._was_resumed = True
             except (json.JSONDecodeError, KeyError, TypeError, ValueError):
                 pass  # Start fresh if state is corrupted
+
+        # Older sessions kept tokens inline in the state file. The log wins only if
+        # it holds at least as many tokens, so an interrupted migration loses nothing.
+        inline_tokens = self.final_tokens
+        if os.path.exists(self.token_log_file):
+            logged_tokens = self._read_token_log()
+            if len(logged_tokens) >= len(inline_tokens):
+                self.final_tokens = logged_tokens
+        if self.final_tokens is inline_tokens and inline_tokens:
+            self._write_token_log(inline_tokens)
+        if self.final_tokens:
+            self._was_resumed = True
+
+    def _ensure_token_indexes(self) -> None:
+        """Index final tokens not yet indexed, starting over if the target language changed."""
+        final_tokens = self.final_tokens
+        if (
+            self._indexed_target_language != self.target_language
+            or len(self._token_flags) > len(final_tokens)
+        ):
+            self._tokens_by_speaker.clear()
+            self._source_tokens = []
+            self._token_flags = array("B")
+            self._indexed_target_language = self.target_language
+
+        # Bound the tail up front: the receive thread may append while we index
+        end = len(final_tokens)
+        for token in final_tokens[len(self._token_flags):end]:
+            self._index_token(token)
+
+    def _index_token(self, token: dict) -> None:
+        target_language = self._indexed_target_language
+        speaker = token.get("speaker")
+        if speaker is not None:
+            self._tokens_by_speaker[speaker].append(token)
+        language = token.get("language")
+        if language and language != target_language:
+            self._source_tokens.append(token)
+
+        flags = 0
+        if token.get("translation_status") == "translation":
+            flags = TOKEN_FLAG_TRANSLATION
+            if token.get("source_language") == target_language:
+                flags |= TOKEN_FLAG_SKIP
+        self._token_flags.append(flags)
+
+    def _read_token_log(self) -> list[dict]:
+        """Read logged tokens, dropping a trailing record cut off by a crash."""
+        tokens: list[dict] = []
+        valid_size = 0
+        with open(self.token_log_file, "rb") as f:
+            for line in f:
+                try:
+                    tokens.append(_decode_json(line))
+                except ValueError:
+                    break
+                valid_size += len(line)
+        if valid_size != os.path.getsize(self.token_log_file):
+            os.truncate(self.token_log_file, valid_size)
+        return tokens
+
+    def _write_token_log(self, tokens: list[dict]) -> None:
+        """Replace the token log with tokens, durably, before it is trusted."""
+        tmp_path = f"{self.token_log_file}.tmp"
+        with open(tmp_path, "wb", buffering=JSON_WRITE_BUFFER_SIZE) as f:
+            for token in tokens:
+                f.write(_encode_json_line(token))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.token_log_file)
+
+    def _append_to_token_log(self, token: dict) -> None:
+        if self._token_log is None:
+            self._token_log = open(self.token_log_file, "ab")
+        self._token_log.write(_encode_json_line(token))
     
     def get_resume_info(self) -> Optional[dict]:
         """Get information about resumed session."""
@@ -133,50 +357,96 @@ class Session:
             "speaker_count": len(self.speaker_profiles),
         }
     
-    def save_state(self) -> None:
-        """Save current session state."""
+    def save_state(self, force: bool = False) -> None:
+        """Save current session state.
+
+        Tokens are persisted incrementally in the token log, so only
+        metadata is rewritten here. Unless forced, writes are skipped if no
+        tokens arrived, or if the last write was recent and few arrived since.
+        """
+        if not force and (
+            not self._dirty_tokens
+            or (
+                time.monotonic() - self._last_state_save < STATE_SAVE_INTERVAL_SEC
+                and self._dirty_tokens < STATE_SAVE_MAX_DIRTY_TOKENS
+            )
+        ):
+            return
+
+        with self._state_lock:
+            self._write_state()
+
+    def _save_state_if_dirty(self) -> None:
+        if self._dirty_tokens:
+            self.save_state(force=True)
+
+    def _write_state(self) -> None:
+        # Tokens arriving during the write stay counted as dirty for the next one
+        dirty_tokens = self._dirty_tokens
+        if self._token_log is not None:
+            self._token_log.flush()
+
         state = {
             "name": self.name,
             "updated": datetime.now().isoformat(),
             "source_languages": self.source_languages,
             "target_language": self.target_language,
             "segment_count": self.segment_count,
-            "tokens": self.final_tokens,
+            "token_count": len(self.final_tokens),
+            # Snapshot the items: the receive thread may add a speaker meanwhile
             "speaker_profiles": {
                 sid: profile.to_dict()
-                for sid, profile in self.speaker_profiles.items()
+                for sid, profile in list(self.speaker_profiles.items())
             }
         }
 
-        with open(self.state_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, ensure_ascii=False, indent=2)
+        # Machine-read only, so no pretty-printing
+        _write_json(self.state_file, state)
+        self._last_state_save = time.monotonic()
+        self._dirty_tokens -= dirty_tokens
     
     def get_speaker_profile(self, speaker_id: int) -> SpeakerProfile:
         """Get or create speaker profile."""
-        if speaker_id not in self.speaker_profiles:
-            self.speaker_profiles[speaker_id] = SpeakerProfile(speaker_id)
-        return self.speaker_profiles[speaker_id]
+        # Consecutive tokens usually come from the same speaker
+        last = self._last_profile
+        if last is not None and last[0] == speaker_id:
+            return last[1]
+        profile = self.speaker_profiles.get(speaker_id)
+        if profile is None:
+            profile = self.speaker_profiles.setdefault(speaker_id, SpeakerProfile(speaker_id))
+        self._last_profile = (speaker_id, profile)
+        return profile
     
     def add_audio_frame(self, frame: bytes) -> None:
         """Add audio frame to buffer."""
-        self.audio_frames.append(frame)
+        start = self._audio_size
+        end = start + len(frame)
+        if end > len(self._audio_buffer):
+            # Grow geometrically so appends stay amortized O(1)
+            self._audio_buffer.extend(bytes(max(len(self._audio_buffer), end - start)))
+        self._audio_buffer[start:end] = frame
+        self._audio_size = end
+
+    @property
+    def audio_data(self) -> memoryview:
+        """Recorded PCM audio so far, without copying."""
+        return memoryview(self._audio_buffer)[:self._audio_size]
     
     def add_token(self, token: dict) -> None:
         """Add a finalized token to the session."""
         self.final_tokens.append(token)
+        self._append_to_token_log(token)
+        self._dirty_tokens += 1
     
     def get_source_language_tokens(self) -> list[dict]:
         """Get all tokens in source languages (non-target languages)."""
-        source_tokens = []
-        for token in self.final_tokens:
-            language = token.get("language")
-            if language and language != self.target_language:
-                source_tokens.append(token)
-        return source_tokens
+        self._ensure_token_indexes()
+        return list(self._source_tokens)
     
     def get_tokens_by_speaker(self, speaker_id: int) -> list[dict]:
         """Get all tokens from a specific speaker."""
-        return [t for t in self.final_tokens if t.get("speaker") == speaker_id]
+        self._ensure_token_indexes()
+        return list(self._tokens_by_speaker.get(speaker_id, ()))
     
     def save_segment(self) -> str:
         """Save current segment (transcript + audio)."""
@@ -186,20 +456,19 @@ class Session:
         
         # Save transcript JSON
         json_path = os.path.join(self.session_dir, f"{base_name}.json")
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "session": self.name,
-                "segment": self.segment_count,
-                "saved": datetime.now().isoformat(),
-                "tokens": self.final_tokens,
-                "speaker_profiles": {
-                    sid: {
-                        "label": profile.get_label(),
-                        "language_counts": dict(profile.language_counts),
-                    }
-                    for sid, profile in self.speaker_profiles.items()
+        _write_json_streamed(json_path, {
+            "session": self.name,
+            "segment": self.segment_count,
+            "saved": datetime.now().isoformat(),
+            "tokens": self.final_tokens,
+            "speaker_profiles": {
+                sid: {
+                    "label": profile.get_label(),
+                    "language_counts": dict(profile.language_counts),
                 }
-            }, f, ensure_ascii=False, indent=2)
+                for sid, profile in self.speaker_profiles.items()
+            }
+        }, stream_key="tokens")
         
         # Save transcript TXT
         txt_path = os.path.join(self.session_dir, f"{base_name}.txt")
@@ -208,25 +477,48 @@ class Session:
         
         # Save audio
         audio_path = None
-        if self.audio_frames:
+        if self._audio_size:
             audio_path = self._save_audio(base_name)
         
         # Save session state
-        self.save_state()
+        self.save_state(force=True)
         
         return json_path
     
     def _save_audio(self, base_name: str) -> str:
-        """Save audio frames to WAV, then convert to MP3 if possible."""
+        """Save audio as MP3 if possible, otherwise as WAV."""
         wav_path = os.path.join(self.session_dir, f"{base_name}.wav")
         mp3_path = os.path.join(self.session_dir, f"{base_name}.mp3")
+
+        # Encode in-process from the PCM buffer when lameenc is installed
+        if lameenc is not None:
+            try:
+                encoder = lameenc.Encoder()
+                encoder.set_bit_rate(MP3_BIT_RATE)
+                encoder.set_in_sample_rate(SAMPLE_RATE)
+                encoder.set_channels(NUM_CHANNELS)
+                encoder.set_quality(MP3_ENCODER_QUALITY)
+                # lameenc only accepts bytes, so feed it bounded slices rather
+                # than copying the whole recording at once
+                audio = self.audio_data
+                with open(mp3_path, "wb") as f:
+                    for start in range(0, len(audio), MP3_ENCODE_CHUNK_BYTES):
+                        f.write(encoder.encode(bytes(audio[start:start + MP3_ENCODE_CHUNK_BYTES])))
+                    f.write(encoder.flush())
+                return mp3_path
+            except Exception:
+                # Encoder failed; drop any partial MP3 and fall back to WAV
+                try:
+                    os.remove(mp3_path)
+                except OSError:
+                    pass
         
         # Save WAV
-        with wave.open(wav_path, "wb") as wf:
+        with open(wav_path, "wb", buffering=WAV_WRITE_BUFFER_SIZE) as f, wave.open(f, "wb") as wf:
             wf.setnchannels(NUM_CHANNELS)
             wf.setsampwidth(AUDIO_SAMPLE_WIDTH)
             wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(b"".join(self.audio_frames))
+            wf.writeframes(self.audio_data)
         
         # Try to convert to MP3 using ffmpeg
         try:
@@ -246,45 +538,45 @@ class Session:
     def render_plain_text(self) -> str:
         """Render tokens as plain text."""
         text_parts: list[str] = []
+        append = text_parts.append
         current_speaker: Optional[int] = None
         current_language: Optional[str] = None
         current_is_translation: bool = False
         
-        for token in self.final_tokens:
-            text = token.get("text", "")
-            speaker = token.get("speaker")
-            language = token.get("language")
-            is_translation = token.get("translation_status") == "translation"
-            
+        self._ensure_token_indexes()
+        for token, flags in zip(self.final_tokens, self._token_flags):
             # Skip translations when source language equals target language
-            source_lang = token.get("source_language")
-            if is_translation and source_lang == self.target_language:
+            if flags & TOKEN_FLAG_SKIP:
                 continue
             
+            get = token.get
+            is_translation = bool(flags & TOKEN_FLAG_TRANSLATION)
+            text = get("text", "")
+            speaker = get("speaker")
+            language = get("language")
+            
             if speaker is not None and speaker != current_speaker:
                 if current_speaker is not None:
-                    text_parts.append("\n\n")
+                    append("\n\n")
                 current_speaker = speaker
                 current_language = None
                 current_is_translation = False
-                profile = self.get_speaker_profile(speaker)
-                text_parts.append(f"{profile.get_label()}:")
+                append(self.get_speaker_profile(speaker).get_label())
+                append(":")
             
             # Language or translation status changed
-            lang_changed = language is not None and language != current_language
-            translation_changed = is_translation != current_is_translation
-            
-            if lang_changed or translation_changed:
+            if (
+                (language is not None and language != current_language)
+                or is_translation != current_is_translation
+            ):
                 current_language = language
                 current_is_translation = is_translation
-                
-                if is_translation:
-                    text_parts.append(f"\n  ↳ [{language}] ")
-                else:
-                    text_parts.append(f"\n[{language}] ")
+                append("\n  ↳ [" if is_translation else "\n[")
+                append(str(language))
+                append("] ")
                 text = text.lstrip()
             
-            text_parts.append(text)
+            append(text)
         
         return "".join(text_parts).strip()
 
@@ -296,24 +588,28 @@ def resolve_language(token: dict, session: Session) -> str:
     """
     speaker = token.get("speaker")
     language: Optional[str] = token.get("language")
-    confidence: float = token.get("language_confidence", 1.0)
     
     if speaker is None:
         return language if language is not None else "en"
     
     profile = session.get_speaker_profile(speaker)
-    last_lang = profile.last_language
     
-    # If confidence is below threshold, use last known language
-    if confidence < LANGUAGE_CONFIDENCE_THRESHOLD and last_lang is not None:
-        return last_lang
-    
-    # Record this language sample
-    if language is not None:
+    # Common case first: a confidently detected language is recorded and used as-is
+    if (
+        language is not None
+        and token.get("language_confidence", 1.0) >= LANGUAGE_CONFIDENCE_THRESHOLD
+    ):
         profile.add_sample(language)
         return language
     
+    # Low confidence or no language: fall back to the speaker's last known language
+    last_lang = profile.last_language
     if last_lang is not None:
         return last_lang
+    
+    # No history yet, so take the detected language even if unsure
+    if language is not None:
+        profile.add_sample(language)
+        return language
     return "en"
 
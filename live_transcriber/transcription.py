@@ -4,13 +4,18 @@ WebSocket transcription and audio capture module.
 
 import json
 import threading
+from collections import deque
 from typing import Optional, Callable
-from queue import Queue
 
 from websockets import ConnectionClosedOK
 from websockets.sync.client import connect
 import pyaudio  # type: ignore
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from .session import Session, resolve_language
 
 SONIOX_WEBSOCKET_URL = "wss://stt-rt.soniox.com/transcribe-websocket"
@@ -21,6 +26,7 @@ AUDIO_FORMAT = "pcm_s16le"
 SAMPLE_RATE = 16000
 NUM_CHANNELS = 1
 CHUNK_SIZE = 3200  # ~200ms at 16kHz
+AUDIO_WAIT_TIMEOUT = 0.05  # seconds between checks for stop while idle
 
 
 def get_soniox_config(
@@ -103,6 +109,11 @@ class Transcriber:
         self._mic_thread: Optional[threading.Thread] = None
         self._recv_thread: Optional[threading.Thread] = None
         self._device_name: Optional[str] = None
+        self._input_devices: Optional[list[tuple[int, dict]]] = None
+
+        # Filled by the PortAudio callback, drained by the mic thread
+        self._audio_queue: deque[bytes] = deque()
+        self._audio_ready = threading.Event()
         
     @property
     def is_running(self) -> bool:
@@ -113,13 +124,15 @@ class Transcriber:
         return self._device_name
     
     def _get_input_devices(self) -> list[tuple[int, dict]]:
-        """Get all available input devices."""
-        devices = []
-        for i in range(self._pyaudio.get_device_count()):
-            info = self._pyaudio.get_device_info_by_index(i)
-            if info.get("maxInputChannels", 0) > 0:
-                devices.append((i, info))
-        return devices
+        """Get all available input devices (enumerated once per PyAudio instance)."""
+        if self._input_devices is None:
+            devices = []
+            for i in range(self._pyaudio.get_device_count()):
+                info = self._pyaudio.get_device_info_by_index(i)
+                if info.get("maxInputChannels", 0) > 0:
+                    devices.append((i, info))
+            self._input_devices = devices
+        return self._input_devices
 
     def _select_device(self, idx: int, info: dict) -> int:
         """Select a device and set its name."""
@@ -128,7 +141,9 @@ class Transcriber:
 
     def _find_microphone(self) -> Optional[int]:
         """Find input device - uses specified device_index, or prefers MacBook mic."""
-        self._pyaudio = pyaudio.PyAudio()
+        if self._pyaudio is None:
+            self._pyaudio = pyaudio.PyAudio()
+            self._input_devices = None
 
         # If a specific device was requested, use it
         if self.device_index is not None:
@@ -165,29 +180,48 @@ class Transcriber:
         idx, info = input_devices[0]
         return self._select_device(idx, info)
     
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: queue captured audio for the mic thread."""
+        if in_data and self._running.is_set():
+            self.session.add_audio_frame(in_data)
+            self._audio_queue.append(in_data)
+            self._audio_ready.set()
+        return (None, pyaudio.paContinue)
+
     def _stream_microphone(self) -> None:
-        """Capture audio from microphone and send to websocket."""
+        """Send captured audio to the websocket as it arrives."""
+        pending = self._audio_queue
+        websocket = self._websocket
+        if websocket is None:
+            return
+
+        # PyAudio's bytes go out as binary frames as-is; no per-chunk conversion
+        send = websocket.send
         try:
-            while self._running.is_set() and self._stream and self._websocket:
-                data = self._stream.read(CHUNK_SIZE, exception_on_overflow=False)
-                self.session.add_audio_frame(data)
-                self._websocket.send(data)
+            while self._running.is_set() and self._websocket:
+                self._audio_ready.wait(AUDIO_WAIT_TIMEOUT)
+                self._audio_ready.clear()
+                while pending:
+                    send(pending.popleft())
         except (OSError, ConnectionError):
             pass
 
         # Signal end-of-audio
         try:
             if self._websocket:
-                self._websocket.send("")
+                send("")
         except (OSError, ConnectionError):
             pass
     
     def _receive_messages(self) -> None:
         """Receive and process messages from websocket."""
+        session = self.session
+        add_token = session.add_token
+
         try:
             while self._running.is_set() and self._websocket:
                 message = self._websocket.recv()
-                res = json.loads(message)
+                res = json_loads(message)
                 
                 # Error from server
                 if res.get("error_code") is not None:
@@ -202,11 +236,10 @@ class Transcriber:
                 for token in res.get("tokens", []):
                     if token.get("text"):
                         # Resolve language using speaker history
-                        resolved_lang = resolve_language(token, self.session)
-                        token["resolved_language"] = resolved_lang
+                        token["resolved_language"] = resolve_language(token, session)
                         
                         if token.get("is_final"):
-                            self.session.add_token(token)
+                            add_token(token)
                             final_tokens.append(token)
                         else:
                             non_final_tokens.append(token)
@@ -240,7 +273,8 @@ class Transcriber:
             rate=SAMPLE_RATE,
             input=True,
             input_device_index=device_idx,
-            frames_per_buffer=CHUNK_SIZE
+            frames_per_buffer=CHUNK_SIZE,
+            stream_callback=self._audio_callback,
         )
         
         self._running.set()
@@ -306,6 +340,7 @@ class Transcriber:
             except OSError:
                 pass
             self._pyaudio = None
+        self._input_devices = None
     
     def wait(self) -> None:
         """Wait for transcription to complete."""
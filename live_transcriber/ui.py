@@ -3,14 +3,19 @@ Rich-based terminal UI for the negotiation assistant.
 Terminal-native keyboard controls (only when terminal is focused).
 """
 
+import io
+import os
+import re
 import sys
 import select
 import threading
 import time
 import tty
 import termios
-from typing import Optional, Union
-from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import NamedTuple, Optional, Union
+from collections import deque
 
 from rich.console import Console, Group
 from rich.panel import Panel
@@ -26,8 +31,20 @@ from .branding import BrandIntro, can_render_images, fetch_logo_bytes, render_lo
 LIVE_VIEW_LINES = 24
 SCROLL_PAGE_SIZE = 20
 UI_REFRESH_RATE = 4  # Hz
-KEY_POLL_INTERVAL = 0.05  # seconds
+KEY_WAIT_TIMEOUT = 0.5  # seconds; the input thread is woken explicitly on stop
+KEY_BUFFER_SIZE = 64  # pending keypresses; oldest are dropped beyond this
 MAIN_LOOP_INTERVAL = 0.1  # seconds
+KEY_READ_SIZE = 64  # bytes read from the terminal per wakeup
+
+ESCAPE_SEQUENCES = (
+    ('\x1b[A', 'UP'),
+    ('\x1b[B', 'DOWN'),
+    ('\x1b[5~', 'PAGEUP'),
+    ('\x1b[6~', 'PAGEDOWN'),
+)
+
+# Internal end-of-segment markers that are never displayed
+_END_MARKER_RE = re.compile("<end>|<END>")
 
 # Christmas colors (matching language_selector.py)
 CHRISTMAS_GREEN = "#165b33"
@@ -132,7 +149,86 @@ SPEAKER_STYLES = [
     ("🧣", "#20b2aa"),  # Scarf - light sea green
 ]
 
-# Language flags are now handled by the languages module
+# Language flags are now handled by the languages module, except for
+# languages without official country flags, which use text codes
+LANGUAGE_TEXT_CODES = {
+    "ca": "[CAT]",  # Catalan
+    "eu": "[BAS]",  # Basque
+    "gl": "[GAL]",  # Galician
+}
+
+# Resolved flag or text code per language, filled on first use
+_language_flags: dict[str, str] = {}
+
+
+@dataclass
+class _RenderState:
+    """Pending state of the transcript renderer between tokens."""
+    current_speaker: Optional[Union[int, str]] = None
+    original_buffer: str = ""
+    translation_buffer: str = ""
+    current_lang: Optional[str] = None
+    buffer_is_final: bool = True
+    should_show_flag: bool = False
+
+
+class _TranscriptLines:
+    """Rendered transcript kept as one Text per line.
+
+    Supports the two Text methods the renderer appends with. Completed lines
+    are never modified again, so frames can share them; only the open last
+    line keeps growing.
+    """
+
+    __slots__ = ("lines", "current")
+
+    def __init__(self) -> None:
+        self.lines: list[Text] = []
+        self.current = Text()
+
+    def append(self, text: str, style: Optional[str] = None) -> None:
+        self.append_tokens(((text, style),))
+
+    def append_tokens(self, tokens) -> None:
+        current = self.current
+        for content, style in tokens:
+            if "\n" not in content:
+                current.append_tokens(((content, style),))
+                continue
+            first, *rest = content.split("\n")
+            if first:
+                current.append_tokens(((first, style),))
+            for piece in rest:
+                self.lines.append(current)
+                current = Text()
+                if piece:
+                    current.append_tokens(((piece, style),))
+        self.current = current
+
+
+class _TokenView(NamedTuple):
+    """The token fields the renderer reads, unpacked once from the wire dict."""
+    text: str
+    speaker: Optional[int]
+    language: Optional[str]
+    is_translation: bool
+    is_final: bool
+    source_language: Optional[str]
+
+
+def _token_view(token: dict) -> _TokenView:
+    # Interned language codes compare by identity against each other, the
+    # LANGUAGE_COLORS keys and the target language, skipping memcmp
+    language = token.get("language")
+    source_language = token.get("source_language")
+    return _TokenView(
+        token.get("text", ""),
+        token.get("speaker"),
+        sys.intern(language) if language else language,
+        token.get("translation_status") == "translation",
+        token.get("is_final", True),
+        sys.intern(source_language) if source_language else source_language,
+    )
 
 
 class LiveTranscriptUI:
@@ -150,59 +246,101 @@ class LiveTranscriptUI:
         self.console = Console()
         
         self._running = threading.Event()
-        self._non_final_tokens: list[dict] = []
+        self._non_final_tokens: list[_TokenView] = []
+        # What the display was last built from; the main loop redraws only on change
+        self._last_display_state: Optional[tuple] = None
 
         # Per-speaker language tracking (for detecting language changes)
         self._speaker_last_language: dict[int, str] = {}
 
+        # Transcript rendered from final tokens so far, extended incrementally
+        self._final_lines = _TranscriptLines()
+        self._final_state = _RenderState()
+        self._final_count = 0
+        self._final_target_language = sys.intern(session.target_language)
+        # Last rendered tail lines with the final count and non-final list they came from
+        self._last_tail: Optional[tuple[int, list[_TokenView], list[Text]]] = None
+
+        # Lookup tables for per-token styling
+        self._speaker_styles: dict[Union[int, str], tuple[str, str]] = {}
+        self._speaker_labels: dict[Union[int, str], str] = {}
+        self._language_colors = self._build_language_colors()
+
         # Status
         self._status_message = ""
         self._error_message = ""
+        self._source_langs_label = ",".join(session.source_languages)
+        self._footer_cache: Optional[tuple[tuple, Text]] = None
+        self._hotkey_bars: dict[bool, Text] = {}
+
+        # Static display pieces, built once and shared by every frame
+        self._live_header_panel = Panel(
+            Text("🎄 Live Translator", style=f"bold {CHRISTMAS_GREEN}"),
+            style=CHRISTMAS_GREEN,
+        )
+        # Only the body of the transcript panel changes between frames
+        self._transcript_panel = Panel(
+            "",
+            title=f"[bold {CHRISTMAS_GREEN}]Live Transcript[/]",
+            border_style=CHRISTMAS_GREEN,
+        )
+        scroll_header = Text("🎙 SCROLL MODE ", style=f"bold {CHRISTMAS_RED}")
+        scroll_header.append("(j/k=scroll, q=exit)", style="dim")
+        self._scroll_header_panel = Panel(scroll_header, style=CHRISTMAS_RED)
+        self._waiting_text = Text("Waiting for speech...", style="dim italic")
+        self._no_content_text = Text("No content")
         
         # Scroll mode
         self._scroll_mode = False
         self._scroll_offset = 0
         self._scroll_lines: list[Text] = []
         self._scroll_total_lines = 0
+        self._scroll_token_count = 0
         
         # Keyboard (terminal-native, only captures when terminal focused)
-        self._key_queue: Queue[str] = Queue()
+        # deque append/popleft are atomic, enough for one producer and one consumer
+        self._key_queue: deque[str] = deque(maxlen=KEY_BUFFER_SIZE)
         self._input_thread: Optional[threading.Thread] = None
+        # Self-pipe: writing to it wakes the input thread out of select()
+        self._wake_pipe: Optional[tuple[int, int]] = None
         self._old_term_settings = None
     
-    def _read_key(self) -> Optional[str]:
-        """Read a single key from terminal (non-blocking)."""
-        if select.select([sys.stdin], [], [], 0)[0]:
-            ch = sys.stdin.read(1)
-            if ch == '\x1b':  # Escape sequence
-                if select.select([sys.stdin], [], [], 0.05)[0]:
-                    ch2 = sys.stdin.read(1)
-                    if ch2 == '[':
-                        if select.select([sys.stdin], [], [], 0.05)[0]:
-                            ch3 = sys.stdin.read(1)
-                            if ch3 == 'A':
-                                return 'UP'
-                            elif ch3 == 'B':
-                                return 'DOWN'
-                            elif ch3 == '5':
-                                sys.stdin.read(1)  # consume ~
-                                return 'PAGEUP'
-                            elif ch3 == '6':
-                                sys.stdin.read(1)  # consume ~
-                                return 'PAGEDOWN'
-                return 'ESC'
-            return ch.lower()
-        return None
+    def _read_keys(self) -> list[str]:
+        """Read pending keys from terminal (call only once stdin is readable)."""
+        # Terminals write an escape sequence in one go, so a single read
+        # returns the whole sequence (or several keys typed in a burst)
+        data = os.read(sys.stdin.fileno(), KEY_READ_SIZE).decode("utf-8", errors="ignore")
+
+        keys = []
+        i = 0
+        while i < len(data):
+            ch = data[i]
+            if ch != '\x1b':
+                keys.append(ch.lower())
+                i += 1
+                continue
+            for sequence, key in ESCAPE_SEQUENCES:
+                if data.startswith(sequence, i):
+                    keys.append(key)
+                    i += len(sequence)
+                    break
+            else:
+                keys.append('ESC')
+                # Skip the rest of an unrecognized CSI sequence
+                i += 3 if data.startswith('\x1b[', i) else 1
+        return keys
     
     def _input_thread_func(self) -> None:
         """Background thread to read terminal input."""
+        wake_fd = self._wake_pipe[0]
         while self._running.is_set():
             try:
-                key = self._read_key()
-                if key:
-                    self._key_queue.put(key)
-                else:
-                    time.sleep(KEY_POLL_INTERVAL)
+                # Sleep in the kernel until a key arrives or we are woken to stop
+                ready = select.select([sys.stdin, wake_fd], [], [], KEY_WAIT_TIMEOUT)[0]
+                if wake_fd in ready:
+                    break
+                if ready:
+                    self._key_queue.extend(self._read_keys())
             except (OSError, termios.error):
                 time.sleep(MAIN_LOOP_INTERVAL)
 
@@ -213,13 +351,24 @@ class LiveTranscriptUI:
             self._old_term_settings = termios.tcgetattr(sys.stdin)
             tty.setcbreak(sys.stdin.fileno())
 
+            self._wake_pipe = os.pipe()
             self._input_thread = threading.Thread(target=self._input_thread_func, daemon=True)
             self._input_thread.start()
         except (OSError, termios.error):
             pass
 
     def _stop_keyboard_listener(self) -> None:
-        """Restore terminal settings."""
+        """Stop the input thread and restore terminal settings."""
+        if self._wake_pipe:
+            read_fd, write_fd = self._wake_pipe
+            try:
+                os.write(write_fd, b"\0")
+                if self._input_thread:
+                    self._input_thread.join(KEY_WAIT_TIMEOUT)
+            finally:
+                os.close(read_fd)
+                os.close(write_fd)
+                self._wake_pipe = None
         if self._old_term_settings:
             try:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._old_term_settings)
@@ -272,10 +421,15 @@ class LiveTranscriptUI:
     
     def _prepare_scroll_content(self) -> None:
         """Prepare scroll content with preserved styling."""
-        full_text = self._render_transcript()
-        # Rich Text.split() returns list[Text], preserving all styling
-        self._scroll_lines = full_text.split("\n")
+        self._scroll_lines = self._render_transcript_lines()
         self._scroll_total_lines = len(self._scroll_lines)
+        self._scroll_token_count = len(self.session.final_tokens)
+
+    def _scroll_content_stale(self) -> bool:
+        """New final tokens arrived and the user is viewing the bottom page."""
+        if len(self.session.final_tokens) == self._scroll_token_count:
+            return False
+        return self._scroll_offset >= self._scroll_total_lines - SCROLL_PAGE_SIZE
     
     def _scroll_up(self, n: int = 1) -> None:
         self._scroll_offset = max(0, self._scroll_offset - n)
@@ -292,7 +446,8 @@ class LiveTranscriptUI:
     
     def _on_tokens(self, final_tokens: list[dict], non_final_tokens: list[dict]) -> None:
         """Callback when tokens received."""
-        self._non_final_tokens = non_final_tokens
+        # Converted here because the non-final tail is re-rendered every frame
+        self._non_final_tokens = [_token_view(token) for token in non_final_tokens]
     
     def _on_error(self, error: str) -> None:
         """Callback on error."""
@@ -304,7 +459,11 @@ class LiveTranscriptUI:
     
     def _render_transcript_plain(self) -> str:
         """Render transcript as plain text with parenthetical translations."""
-        parts: list[str] = []
+        out = io.StringIO()
+        write = out.write
+        strip_end = _END_MARKER_RE.sub
+        target_language = self.session.target_language
+        get_label = self._get_speaker_label
         current_speaker: Optional[int] = None
 
         # Buffers for accumulating original + translation pairs
@@ -315,31 +474,29 @@ class LiveTranscriptUI:
             text = token.get("text", "")
             speaker = token.get("speaker")
             is_translation = token.get("translation_status") == "translation"
-            source_lang = token.get("source_language")
 
             # Skip translations when source language equals target language
-            if is_translation and source_lang == self.session.target_language:
+            if is_translation and token.get("source_language") == target_language:
                 continue
 
             # Speaker changed - flush buffers, start new paragraph
             if speaker is not None and speaker != current_speaker:
                 # Flush pending content
-                clean_orig = self._clean_display_text(original_buffer)
-                clean_trans = self._clean_display_text(translation_buffer)
-                if clean_orig:
-                    parts.append(clean_orig)
-                    if clean_trans:
-                        parts.append(f" ({clean_trans.strip()})")
+                original_buffer = strip_end("", original_buffer)
+                if original_buffer:
+                    write(original_buffer)
+                    translation_buffer = strip_end("", translation_buffer).strip()
+                    if translation_buffer:
+                        write(f" ({translation_buffer})")
                 original_buffer = ""
                 translation_buffer = ""
 
                 if current_speaker is not None:
-                    parts.append("\n\n")
+                    write("\n\n")
                 current_speaker = speaker
 
                 # Speaker header inline for compact readability.
-                profile = self.session.get_speaker_profile(speaker)
-                parts.append(f"{profile.get_label()}: ")
+                write(f"{get_label(speaker)}: ")
                 text = text.lstrip()
 
             # Accumulate text
@@ -348,151 +505,211 @@ class LiveTranscriptUI:
             else:
                 # If we have pending translation, flush first
                 if translation_buffer:
-                    clean_orig = self._clean_display_text(original_buffer)
-                    clean_trans = self._clean_display_text(translation_buffer)
-                    parts.append(clean_orig)
-                    parts.append(f" ({clean_trans.strip()})")
+                    write(strip_end("", original_buffer))
+                    write(f" ({strip_end('', translation_buffer).strip()})")
                     original_buffer = ""
                     translation_buffer = ""
                 original_buffer += text
 
         # Final flush
-        clean_orig = self._clean_display_text(original_buffer)
-        clean_trans = self._clean_display_text(translation_buffer)
-        if clean_orig:
-            parts.append(clean_orig)
-            if clean_trans:
-                parts.append(f" ({clean_trans.strip()})")
-
-        return "".join(parts)
+        original_buffer = strip_end("", original_buffer)
+        if original_buffer:
+            write(original_buffer)
+            translation_buffer = strip_end("", translation_buffer).strip()
+            if translation_buffer:
+                write(f" ({translation_buffer})")
+
+        return out.getvalue()
     
     def _get_speaker_style(self, speaker_id: Union[int, str]) -> tuple[str, str]:
         """Get a unique emoji + color pair for a speaker."""
-        sid = int(speaker_id) if isinstance(speaker_id, str) else speaker_id
-        return SPEAKER_STYLES[sid % len(SPEAKER_STYLES)]
+        style = self._speaker_styles.get(speaker_id)
+        if style is None:
+            # Speaker ids stay as received: Session keys live profiles by the wire
+            # value, so only the style index is coerced, once per speaker
+            sid = int(speaker_id) if isinstance(speaker_id, str) else speaker_id
+            style = SPEAKER_STYLES[sid % len(SPEAKER_STYLES)]
+            self._speaker_styles[speaker_id] = style
+        return style
+
+    def _get_speaker_label(self, speaker_id: Union[int, str]) -> str:
+        """Get a speaker's display label (labels are fixed per speaker id)."""
+        label = self._speaker_labels.get(speaker_id)
+        if label is None:
+            label = self.session.get_speaker_profile(speaker_id).get_label()
+            self._speaker_labels[speaker_id] = label
+        return label
+
+    def _build_language_colors(self) -> dict[str, str]:
+        """Language colors with the current target language mapped to white."""
+        colors = dict(LANGUAGE_COLORS)
+        colors[sys.intern(self.session.target_language)] = "white"
+        return colors
 
     def _get_language_color(self, language: str) -> str:
         """Get color for a language. Target language is always white."""
-        if language == self.session.target_language:
-            return "white"
-        return LANGUAGE_COLORS.get(language, DEFAULT_LANGUAGE_COLOR)
+        return self._language_colors.get(language, DEFAULT_LANGUAGE_COLOR)
 
     def _get_language_flag(self, language: str) -> str:
         """Get flag emoji or text code for a language."""
-        # Languages without official country flags use text codes
-        TEXT_CODES = {
-            "ca": "[CAT]",  # Catalan
-            "eu": "[BAS]",  # Basque
-            "gl": "[GAL]",  # Galician
-        }
-        if language in TEXT_CODES:
-            return TEXT_CODES[language]
-        return get_language_flag(language)
+        flag = _language_flags.get(language)
+        if flag is None:
+            flag = LANGUAGE_TEXT_CODES.get(language) or get_language_flag(language)
+            _language_flags[language] = flag
+        return flag
 
     def _clean_display_text(self, text: str) -> str:
         """Remove internal tokens like <end> that shouldn't be displayed."""
-        return text.replace("<end>", "").replace("<END>", "")
+        return _END_MARKER_RE.sub("", text)
 
-    def _render_speaker_header(self, text: Text, speaker: Union[int, str]) -> None:
+    def _render_speaker_header(self, text: _TranscriptLines, speaker: Union[int, str]) -> None:
         """Render speaker header inline without emoji for stable alignment."""
         _, speaker_color = self._get_speaker_style(speaker)
-        profile = self.session.get_speaker_profile(speaker)
-        label = profile.get_label()
+        label = self._get_speaker_label(speaker)
         text.append(f"{label}: ", style=f"bold {speaker_color}")
 
-    def _render_transcript(self) -> Text:
-        """Render transcript with inline parenthetical translations and language colors.
+    def _render_transcript_lines(self) -> list[Text]:
+        """Render transcript lines with inline parenthetical translations and language colors.
 
         Language flags are shown when:
         - A speaker starts speaking (to identify their language)
         - A speaker switches language mid-speech
         """
-        text = Text()
-        current_speaker: Optional[Union[int, str]] = None
-        original_buffer = ""
-        translation_buffer = ""
-        current_lang: Optional[str] = None
-        buffer_is_final = True
-        should_show_flag = False
-
-        all_tokens = self.session.final_tokens + self._non_final_tokens
-
-        for token in all_tokens:
-            token_text = token.get("text", "")
-            speaker = token.get("speaker")
-            language = token.get("language")
-            is_translation = token.get("translation_status") == "translation"
-            is_final = token.get("is_final", True)
-            source_lang = token.get("source_language")
-
-            # Skip translations when source language equals target language
-            if is_translation and source_lang == self.session.target_language:
-                continue
-
-            # Handle speaker change
-            if speaker is not None and speaker != current_speaker:
-                # Flush pending content
-                if original_buffer or translation_buffer:
-                    self._flush_buffers_with_flag(
-                        text, original_buffer, translation_buffer,
-                        current_lang, buffer_is_final, show_flag=should_show_flag
-                    )
-                original_buffer = ""
-                translation_buffer = ""
-                buffer_is_final = True
+        lines = self._render_final().lines + self._render_tail()
+        # Like Text.split(), a trailing newline does not start another line
+        if len(lines) > 1 and not lines[-1]:
+            lines.pop()
+        return lines
+
+    def _render_final(self) -> _TranscriptLines:
+        """Extend the cached rendering of final tokens with any new ones."""
+        final_tokens = self.session.final_tokens
+        if (
+            len(final_tokens) < self._final_count
+            or self.session.target_language != self._final_target_language
+        ):
+            self._final_lines = _TranscriptLines()
+            self._final_state = _RenderState()
+            self._final_count = 0
+            self._final_target_language = sys.intern(self.session.target_language)
+            self._language_colors = self._build_language_colors()
+            self._last_tail = None
+
+        # Consume only the unseen tail, bounded up front: the receive thread may
+        # append more while we render, and those belong to the next frame
+        final_count = len(final_tokens)
+        consume = self._consume_token
+        final_lines = self._final_lines
+        final_state = self._final_state
+        for token in final_tokens[self._final_count:final_count]:
+            consume(final_lines, final_state, _token_view(token))
+        self._final_count = final_count
+        return final_lines
+
+    def _render_tail(self) -> list[Text]:
+        """Render the lines that follow the completed final lines.
+
+        Starts from a copy of the open final line, then adds pending buffers and
+        non-final tokens. The result is small and is rebuilt only when final
+        tokens were consumed or the non-final tokens changed.
+        """
+        non_final_tokens = self._non_final_tokens
+        last = self._last_tail
+        if (
+            last is not None
+            and last[0] == self._final_count
+            and last[1] is non_final_tokens
+        ):
+            return last[2]
+
+        tail = _TranscriptLines()
+        tail.current = self._final_lines.current.copy()
+        final_state = self._final_state
+        if non_final_tokens:
+            state = replace(final_state)
+            consume = self._consume_token
+            for token in non_final_tokens:
+                consume(tail, state, token)
+        else:
+            # Flushing only reads the state, so the cached one can be used as is
+            state = final_state
 
-                # Add paragraph break and speaker header
-                if current_speaker is not None:
-                    text.append("\n\n")
-                current_speaker = speaker
-                self._render_speaker_header(text, speaker)
+        # Final flush
+        self._flush_buffers_with_flag(
+            tail, state.original_buffer, state.translation_buffer,
+            state.current_lang, state.buffer_is_final, show_flag=state.should_show_flag
+        )
+        lines = tail.lines
+        lines.append(tail.current)
+        self._last_tail = (self._final_count, non_final_tokens, lines)
+        return lines
 
-                should_show_flag = True
-                current_lang = language
-                token_text = token_text.lstrip()
+    def _consume_token(self, text: _TranscriptLines, state: _RenderState, token: _TokenView) -> None:
+        """Advance the renderer by one token, appending any completed output to text."""
+        token_text, speaker, language, is_translation, is_final, source_lang = token
 
-            # Track finality
-            if not is_final:
-                buffer_is_final = False
+        # Skip translations when source language equals target language
+        if is_translation and source_lang == self._final_target_language:
+            return
 
-            # Accumulate text
-            if is_translation:
-                translation_buffer += token_text
-            else:
-                # Handle language change
-                if language and current_lang and language != current_lang:
-                    self._flush_buffers_with_flag(
-                        text, original_buffer, translation_buffer,
-                        current_lang, buffer_is_final, show_flag=True
-                    )
-                    original_buffer = ""
-                    translation_buffer = ""
-                    buffer_is_final = is_final
-                    should_show_flag = True
-                # Flush completed phrase (has translation)
-                elif translation_buffer:
-                    self._flush_buffers_with_flag(
-                        text, original_buffer, translation_buffer,
-                        current_lang, buffer_is_final, show_flag=should_show_flag
-                    )
-                    original_buffer = ""
-                    translation_buffer = ""
-                    buffer_is_final = is_final
-                    should_show_flag = False
+        # Handle speaker change
+        if speaker is not None and speaker != state.current_speaker:
+            # Flush pending content
+            if state.original_buffer or state.translation_buffer:
+                self._flush_buffers_with_flag(
+                    text, state.original_buffer, state.translation_buffer,
+                    state.current_lang, state.buffer_is_final, show_flag=state.should_show_flag
+                )
+            state.original_buffer = ""
+            state.translation_buffer = ""
+            state.buffer_is_final = True
+
+            # Add paragraph break and speaker header
+            if state.current_speaker is not None:
+                text.append("\n\n")
+            state.current_speaker = speaker
+            self._render_speaker_header(text, speaker)
+
+            state.should_show_flag = True
+            state.current_lang = language
+            token_text = token_text.lstrip()
+
+        # Track finality
+        if not is_final:
+            state.buffer_is_final = False
+
+        # Accumulate text
+        if is_translation:
+            state.translation_buffer += token_text
+            return
 
-                original_buffer += token_text
-                current_lang = language
+        # Handle language change
+        if language and state.current_lang and language != state.current_lang:
+            self._flush_buffers_with_flag(
+                text, state.original_buffer, state.translation_buffer,
+                state.current_lang, state.buffer_is_final, show_flag=True
+            )
+            state.original_buffer = ""
+            state.translation_buffer = ""
+            state.buffer_is_final = is_final
+            state.should_show_flag = True
+        # Flush completed phrase (has translation)
+        elif state.translation_buffer:
+            self._flush_buffers_with_flag(
+                text, state.original_buffer, state.translation_buffer,
+                state.current_lang, state.buffer_is_final, show_flag=state.should_show_flag
+            )
+            state.original_buffer = ""
+            state.translation_buffer = ""
+            state.buffer_is_final = is_final
+            state.should_show_flag = False
 
-        # Final flush
-        self._flush_buffers_with_flag(
-            text, original_buffer, translation_buffer,
-            current_lang, buffer_is_final, show_flag=should_show_flag
-        )
-        return text
+        state.original_buffer += token_text
+        state.current_lang = language
 
     def _flush_buffers_with_flag(
         self,
-        text: Text,
+        text: _TranscriptLines,
         original: str,
         translation: str,
         lang: str,
@@ -509,48 +726,50 @@ class LiveTranscriptUI:
 
         lang_color = self._get_language_color(lang) if lang else DEFAULT_LANGUAGE_COLOR
 
-        # Apply styling based on finality
+        # Collect styled segments and append them to the transcript in one go
         if is_final:
-            if original:
-                text.append(original, style=lang_color)
+            segments = [(original, lang_color)] if original else []
             # Add flag after original text, before translation (only if requested)
             if show_flag and lang:
-                flag = self._get_language_flag(lang)
-                text.append(f" {flag}", style="dim")
-            if translation:
-                text.append(" (", style="dim")
-                text.append(translation.strip(), style="white")
-                text.append(")", style="dim")
+                segments.append((f" {self._get_language_flag(lang)}", "dim"))
+            translation_style = "white"
         else:
             # Non-final (in-progress) text is dim and italic - no flag yet
-            if original:
-                text.append(original, style=f"dim italic {lang_color}")
-            if translation:
-                text.append(" (", style="dim")
-                text.append(translation.strip(), style="dim italic white")
-                text.append(")", style="dim")
+            segments = [(original, f"dim italic {lang_color}")] if original else []
+            translation_style = "dim italic white"
+        if translation:
+            segments.append((" (", "dim"))
+            segments.append((translation.strip(), translation_style))
+            segments.append((")", "dim"))
+
+        if segments:
+            text.append_tokens(segments)
     
     def _render_live_transcript(self) -> Text:
         """Render last N lines of transcript."""
-        full = self._render_transcript()
-        if not full:
-            return Text("Waiting for speech...", style="dim italic")
-
-        styled_lines = full.split("\n")
-        if len(styled_lines) <= LIVE_VIEW_LINES:
-            return full
+        final_lines = self._render_final().lines
+        tail_lines = self._render_tail()
+        total = len(final_lines) + len(tail_lines)
+        if total == 1 and not tail_lines[0]:
+            return self._waiting_text
+
+        # A trailing newline is not a line
+        line_count = total - 1 if total > 1 and not tail_lines[-1] else total
+        if line_count <= LIVE_VIEW_LINES:
+            return Text("\n").join(final_lines + tail_lines)
+
+        # Only the last few lines are touched, however long the transcript is
+        recent = final_lines[-LIVE_VIEW_LINES:] + tail_lines
+        if line_count < total:
+            recent.pop()
 
-        visible = styled_lines[-LIVE_VIEW_LINES:]
         result = Text()
         result.append(
-            f"↑ {len(styled_lines) - LIVE_VIEW_LINES} more (v=scroll) ",
+            f"↑ {line_count - LIVE_VIEW_LINES} more (v=scroll) ",
             style=f"dim {CHRISTMAS_GREEN}",
         )
         result.append("\n")
-        for i, line in enumerate(visible):
-            if i > 0:
-                result.append("\n")
-            result.append(line)
+        result.append(Text("\n").join(recent[-LIVE_VIEW_LINES:]))
         return result
     
     def _render_status_bar(self) -> Text:
@@ -569,8 +788,7 @@ class LiveTranscriptUI:
         text.append(f" │ {len(self.session.final_tokens)} tokens", style="dim")
 
         # Show language configuration
-        source_langs = ",".join(self.session.source_languages)
-        text.append(f" │ Langs: {source_langs} → {self.session.target_language}", style="dim")
+        text.append(f" │ Langs: {self._source_langs_label} → {self.session.target_language}", style="dim")
 
         if self._error_message:
             text.append(f" │ {self._error_message}", style=CHRISTMAS_RED)
@@ -582,6 +800,10 @@ class LiveTranscriptUI:
     
     def _render_hotkey_bar(self) -> Text:
         """Render hotkey hints with Christmas theme."""
+        text = self._hotkey_bars.get(self._scroll_mode)
+        if text is not None:
+            return text
+
         text = Text()
         if self._scroll_mode:
             pairs = [("j↓k↑", "scroll"), ("du", "page"), ("gG", "ends"), ("q", "exit")]
@@ -593,20 +815,33 @@ class LiveTranscriptUI:
                 text.append("  ", style="dim")
             text.append(k, style=CHRISTMAS_GOLD)
             text.append(f"={d}", style="dim")
+        self._hotkey_bars[self._scroll_mode] = text
         return text
 
     def _render_footer_bar(self) -> Text:
         """Render a single clean footer line (status + hotkeys)."""
+        # The footer only changes with these inputs, so rebuild it only then
+        key = (
+            self._scroll_mode,
+            self._scroll_offset,
+            self._scroll_total_lines,
+            self.session.name,
+            len(self.session.final_tokens),
+            self.session.target_language,
+            self._status_message,
+            self._error_message,
+        )
+        if self._footer_cache is not None and self._footer_cache[0] == key:
+            return self._footer_cache[1]
+
         footer = self._render_status_bar()
         footer.append(" │ ", style="dim")
         footer.append(self._render_hotkey_bar())
+        self._footer_cache = (key, footer)
         return footer
     
     def _build_scroll_display(self) -> Group:
         """Build scroll display with Christmas theme."""
-        header = Text("🎙 SCROLL MODE ", style=f"bold {CHRISTMAS_RED}")
-        header.append("(j/k=scroll, q=exit)", style="dim")
-
         visible = self._scroll_lines[self._scroll_offset:self._scroll_offset + SCROLL_PAGE_SIZE]
         if visible:
             # Join Text objects with newlines, preserving all styling
@@ -616,36 +851,38 @@ class LiveTranscriptUI:
                     content.append("\n")
                 content.append(line)
         else:
-            content = Text("No content")
+            content = self._no_content_text
 
         return Group(
-            Panel(header, style=CHRISTMAS_RED),
+            self._scroll_header_panel,
             Panel(content, border_style=CHRISTMAS_RED),
             self._render_footer_bar(),
         )
     
+    def _display_state(self) -> tuple:
+        """Everything the display depends on that can change between frames."""
+        return (
+            len(self.session.final_tokens),
+            self._non_final_tokens,
+            self._status_message,
+            self._error_message,
+            self._scroll_mode,
+            self._scroll_offset,
+        )
+
     def _build_display(self) -> Group:
         """Build main display with Christmas theme."""
         if self._scroll_mode:
             return self._build_scroll_display()
 
-        parts = []
-
-        # Header
-        header = Text("🎄 Live Translator", style=f"bold {CHRISTMAS_GREEN}")
-        parts.append(Panel(header, style=CHRISTMAS_GREEN))
-
-        # Main transcript panel
-        parts.append(Panel(
-            self._render_live_transcript(),
-            title=f"[bold {CHRISTMAS_GREEN}]Live Transcript[/]",
-            border_style=CHRISTMAS_GREEN,
-        ))
-
-        # Status and hotkeys
-        parts.append(self._render_footer_bar())
-
-        return Group(*parts)
+        # Panel reads its renderable once per render, so swapping it is safe
+        # while Live redraws the previous frame
+        self._transcript_panel.renderable = self._render_live_transcript()
+        return Group(
+            self._live_header_panel,
+            self._transcript_panel,
+            self._render_footer_bar(),
+        )
     
     def run(self) -> None:
         """Run the UI."""
@@ -659,8 +896,15 @@ class LiveTranscriptUI:
         # Initial display
         self.console.clear()
         if self.brand_intro:
-            source_logo = fetch_logo_bytes(self.brand_intro.source.logo_url, timeout_sec=5.0)
-            target_logo = fetch_logo_bytes(self.brand_intro.target.logo_url, timeout_sec=5.0)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                source_future = executor.submit(
+                    fetch_logo_bytes, self.brand_intro.source.logo_url, 5.0
+                )
+                target_future = executor.submit(
+                    fetch_logo_bytes, self.brand_intro.target.logo_url, 5.0
+                )
+                source_logo = source_future.result()
+                target_logo = target_future.result()
             source_rendered = (
                 render_logo_text(
                     source_logo,
@@ -739,18 +983,30 @@ class LiveTranscriptUI:
             with Live(self._build_display(), console=self.console, refresh_per_second=UI_REFRESH_RATE, vertical_overflow="crop") as live:
                 while self._running.is_set() and self.transcriber.is_running:
                     # Process keypresses
-                    try:
-                        while True:
-                            key = self._key_queue.get_nowait()
-                            self._handle_key(key)
-                    except Empty:
-                        pass
-
-                    # Update scroll content
-                    if self._scroll_mode:
-                        self._prepare_scroll_content()
-
-                    live.update(self._build_display())
+                    dirty = bool(self._key_queue)
+                    while self._key_queue:
+                        self._handle_key(self._key_queue.popleft())
+
+                    # Quit requested: don't render the old state one last time
+                    if not self._running.is_set():
+                        break
+
+                    if dirty or self._display_state() != self._last_display_state:
+                        # Update scroll content only when there is something new to show
+                        if self._scroll_mode and self._scroll_content_stale():
+                            self._prepare_scroll_content()
+                            # Stay pinned to the bottom as new lines arrive
+                            self._scroll_to_bottom()
+
+                        live.update(self._build_display())
+                        self._last_display_state = self._display_state()
+
+                    # Debounced checkpoint, kept off the websocket receive thread
+                    self.session.save_state()
+
+                    # A key arrived while rendering: handle it right away
+                    if self._key_queue:
+                        continue
                     time.sleep(MAIN_LOOP_INTERVAL)
                     
         except KeyboardInterrupt:
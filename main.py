@@ -6,28 +6,45 @@ Real-time multilingual transcription and translation with interactive scroll mod
 
 import argparse
 import os
+import re
 import sys
 
 MIN_PYTHON = (3, 11)
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
+# Sessions are stored next to this script
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-from live_transcriber import (
-    Session,
-    Transcriber,
-    LiveTranscriptUI,
-    list_audio_devices,
-)
-from live_transcriber.branding import build_brand_intro
+# Preferred default input device: a MacBook's built-in microphone
+DEFAULT_MIC_RE = re.compile(r"^(?=.*macbook)(?=.*microphone)", re.IGNORECASE | re.DOTALL)
+
+# Settings read from the environment (see .env.example)
+ENV_VARS = ("SONIOX_API_KEY", "BRANDFETCH_API_KEY", "SOURCE_BRAND_DOMAIN", "TARGET_BRAND_DOMAIN")
 
 # Default context for transcription
 DEFAULT_CONTEXT = """This is a casual conversation between people speaking different languages. Pay attention to conversational nuances, cultural references, and emotional tone."""
 
 
+def _language_code(value: str) -> str:
+    """argparse type: a single supported language code."""
+    from live_transcriber.languages import LANGUAGE_CODES
+
+    code = value.strip().lower()
+    if code not in LANGUAGE_CODES:
+        raise argparse.ArgumentTypeError(f"invalid language code: {code}")
+    return code
+
+
+def _language_code_list(value: str) -> list[str]:
+    """argparse type: comma-separated supported language codes."""
+    from live_transcriber.languages import LANGUAGE_CODES
+
+    codes = [code.strip().lower() for code in value.split(",")]
+    invalid = [code for code in codes if code not in LANGUAGE_CODES]
+    if invalid:
+        raise argparse.ArgumentTypeError(f"invalid language codes: {', '.join(invalid)}")
+    return codes
+
+
 def main():
     if sys.version_info < MIN_PYTHON:
         print(
@@ -75,13 +92,13 @@ Scroll mode navigation:
     )
     parser.add_argument(
         "--source-languages",
-        type=str,
+        type=_language_code_list,
         default=None,
         help="Comma-separated list of source language codes (e.g., 'zh,es,fr')"
     )
     parser.add_argument(
         "--target-language",
-        type=str,
+        type=_language_code,
         default=None,
         help="Target translation language code (e.g., 'en')"
     )
@@ -89,18 +106,17 @@ Scroll mode navigation:
     
     # List devices mode
     if args.list_devices:
+        from live_transcriber import list_audio_devices
         devices = list_audio_devices()
         print("Available audio input devices:")
         
-        # Find which would be default (MacBook mic preferred)
+        # Mark the first MacBook mic as the default while printing
         default_idx = None
         for idx, name in devices:
-            if "macbook" in name.lower() and "microphone" in name.lower():
+            marker = ""
+            if default_idx is None and DEFAULT_MIC_RE.search(name):
                 default_idx = idx
-                break
-        
-        for idx, name in devices:
-            marker = " (default)" if idx == default_idx else ""
+                marker = " (default)"
             print(f"  [{idx}] {name}{marker}")
         
         print("\nUse --device <index> to select a specific device.")
@@ -109,6 +125,18 @@ Scroll mode navigation:
     # Require session name for normal operation
     if not args.session:
         parser.error("--session/-s is required")
+
+    # Only the full run needs the environment file and the transcription stack.
+    # Skip the .env lookup entirely when the environment already has every setting.
+    if not all(os.environ.get(name) for name in ENV_VARS):
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            pass
+
+    from live_transcriber import Session, Transcriber, LiveTranscriptUI
+    from live_transcriber.branding import build_brand_intro
     
     # Check for API keys
     soniox_key = os.environ.get("SONIOX_API_KEY")
@@ -131,50 +159,31 @@ Scroll mode navigation:
     source_languages: list[str] = []
     target_language: str = ""
 
-    # Check if languages provided via CLI
+    # Check if languages provided via CLI (already validated by argparse)
     if args.source_languages and args.target_language:
-        source_languages = [lang.strip() for lang in args.source_languages.split(',')]
-        target_language = args.target_language.strip()
-
-        # Validate language codes
-        from live_transcriber.languages import get_all_language_codes
-        valid_codes = get_all_language_codes()
-        invalid_source = [lang for lang in source_languages if lang not in valid_codes]
-        if invalid_source:
-            print(f"Error: Invalid source language codes: {', '.join(invalid_source)}")
-            sys.exit(1)
-        if target_language not in valid_codes:
-            print(f"Error: Invalid target language code: {target_language}")
-            sys.exit(1)
+        source_languages = args.source_languages
+        target_language = args.target_language
     else:
-        # Interactive mode (default)
-        from live_transcriber.language_selector import select_languages
-        source_languages, target_language = select_languages()
-        if not source_languages or not target_language:
-            print("Language selection cancelled")
-            sys.exit(0)
+        # A resumed session keeps its saved languages, so only ask when there are none
+        saved_languages = Session.peek_languages(args.session, BASE_DIR)
+        if saved_languages:
+            source_languages, target_language = saved_languages
+        else:
+            # Interactive mode (default)
+            from live_transcriber.language_selector import select_languages
+            source_languages, target_language = select_languages()
+            if not source_languages or not target_language:
+                print("Language selection cancelled")
+                sys.exit(0)
 
     # Initialize base components
-    base_dir = os.path.dirname(os.path.abspath(__file__))
     session = Session(
         args.session,
-        base_dir,
+        BASE_DIR,
         source_languages,
         target_language,
     )
 
-    # Handle old sessions without language config
-    if session.was_resumed and not hasattr(session, 'source_languages'):
-        print("\n⚠️  This session needs language configuration\n")
-        from live_transcriber.language_selector import select_languages
-        source_languages, target_language = select_languages()
-        if not source_languages or not target_language:
-            print("Language selection cancelled")
-            sys.exit(0)
-        session.source_languages = source_languages
-        session.target_language = target_language
-        session.save_state()
-
     # Initialize transcriber and UI
     transcriber = Transcriber(
         api_key=soniox_key,